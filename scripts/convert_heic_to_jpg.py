@@ -11,24 +11,100 @@ Requirements:
     pip install pillow pillow-heif
 """
 
+import io
+import mmap
 import os
 import sys
+from functools import partial
+from multiprocessing import Pool
 from pathlib import Path
 from PIL import Image
 import pillow_heif
 
-def convert_heic_to_jpg(input_dir, output_dir, quality=95):
+from file_utils import list_images
+
+# Optional fast-path encoder (libjpeg-turbo direct); Pillow is the fallback
+try:
+    import numpy as np
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+
+def _convert_one(heic_path, output_dir, quality, progressive=True):
+    """
+    Convert a single HEIC file to JPG (runs in a worker process).
+
+    Returns:
+        tuple: (name, input_size_kb, output_size_kb, error) where error
+               is None on success and the error message on failure.
+    """
+    heic_file = Path(heic_path)
+    output_file = Path(output_dir) / (heic_file.stem + '.jpg')
+
+    # One worker already runs per core, so let each libheif decode stay
+    # single-threaded instead of oversubscribing the CPU
+    pillow_heif.options.DECODE_THREADS = 1
+
+    try:
+        # Decode HEIC directly (skips the generic PIL dispatcher and its
+        # mode probing); HDR sources are folded down to 8-bit. Memory-map
+        # the input so the decoder reads straight from the page cache
+        # instead of through a buffered copy into the heap; read_heif
+        # decodes eagerly, so the map can be closed right after.
+        with open(heic_file, 'rb') as src, \
+                mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The mapping already knows the input size - no stat() needed
+            input_size = mm.size() / 1024  # KB
+            heif = pillow_heif.read_heif(mm, convert_hdr_to_8bit=True)
+
+        width, height = heif.size
+
+        if (simplejpeg is not None and not progressive
+                and heif.mode == 'RGB' and heif.stride == width * 3):
+            # Hot path: hand the decoded RGB buffer straight to
+            # libjpeg-turbo, skipping Pillow's per-save overhead entirely.
+            # simplejpeg only writes baseline JPEGs, so this path is only
+            # taken when baseline output was requested (--baseline).
+            arr = np.frombuffer(heif.data, np.uint8).reshape(height, width, 3)
+            jpeg_bytes = simplejpeg.encode_jpeg(arr, quality=quality,
+                                                colorspace='RGB', fastdct=True)
+            output_file.write_bytes(jpeg_bytes)
+            output_size = len(jpeg_bytes) / 1024  # KB
+        else:
+            # Wrap the decoded buffer without an extra copy or convert() pass
+            image = Image.frombytes(heif.mode, heif.size, heif.data, 'raw', heif.mode, heif.stride)
+
+            # Convert anything JPEG can't store (RGBA, LA, ...) to RGB
+            if image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+
+            # Save as JPG - encode to memory first so the output size
+            # comes from the buffer instead of a stat() on the file
+            # Progressive + optimized Huffman tables shave a few percent off
+            # the file size at the same quality
+            buf = io.BytesIO()
+            image.save(buf, 'JPEG', quality=quality, optimize=True,
+                       progressive=progressive)
+            output_file.write_bytes(buf.getbuffer())
+            output_size = buf.tell() / 1024  # KB
+
+        return (heic_file.name, input_size, output_size, None)
+    except Exception as e:
+        return (heic_file.name, 0, 0, str(e))
+
+
+def convert_heic_to_jpg(input_dir, output_dir, quality=95, progressive=True, force=False):
     """
     Convert all HEIC images in input_dir to JPG format in output_dir.
-    
+
     Args:
         input_dir (str): Directory containing HEIC images
         output_dir (str): Directory to save converted JPG images
         quality (int): JPG quality (1-100, default 95)
+        progressive (bool): Write progressive JPEGs (default True)
+        force (bool): Reconvert even if the JPG is already up to date
     """
-    # Register HEIF opener with Pillow
-    pillow_heif.register_heif_opener()
-    
     # Create input and output paths
     input_path = Path(input_dir)
     output_path = Path(output_dir)
@@ -42,54 +118,64 @@ def convert_heic_to_jpg(input_dir, output_dir, quality=95):
     output_path.mkdir(parents=True, exist_ok=True)
     print(f"📁 Output directory: {output_path.absolute()}")
     
-    # Find all HEIC files (case-insensitive)
-    heic_files = []
-    for ext in ['*.heic', '*.HEIC', '*.heif', '*.HEIF']:
-        heic_files.extend(input_path.glob(ext))
-    
+    # Find all HEIC files (case-insensitive, one directory pass)
+    heic_files = list_images(input_path, ('.heic', '.heif'))
+
     if not heic_files:
         print(f"⚠️  No HEIC files found in '{input_dir}'")
         return
+
+    print(f"\n🔍 Found {len(heic_files)} HEIC file(s)")
+
+    # Skip files whose JPG already exists and is newer than the source,
+    # so re-runs only pay for new or changed images (--force reconverts
+    # everything, e.g. after changing quality)
+    pending_files = []
+    skipped_count = 0
+    for heic_file in heic_files:
+        output_file = output_path / (heic_file.stem + '.jpg')
+        if (not force and output_file.exists()
+                and output_file.stat().st_mtime >= heic_file.stat().st_mtime):
+            skipped_count += 1
+        else:
+            pending_files.append(heic_file)
+
+    if skipped_count > 0:
+        print(f"⏭️  Skipping {skipped_count} already-converted file(s)")
+
+    if not pending_files:
+        print("✅ Everything is already up to date!\n")
+        return
+
+    print(f"🔄 Converting {len(pending_files)} file(s)\n")
     
-    print(f"\n🔍 Found {len(heic_files)} HEIC file(s) to convert\n")
-    
-    # Convert each HEIC file
+    # Convert files in parallel - each file is independent and CPU-bound,
+    # so one worker per core scales close to linearly
     converted_count = 0
     failed_count = 0
-    
-    for heic_file in heic_files:
-        try:
-            # Generate output filename
-            output_filename = heic_file.stem + '.jpg'
-            output_file = output_path / output_filename
-            
-            print(f"🔄 Converting: {heic_file.name} → {output_filename}")
-            
-            # Open HEIC image
-            image = Image.open(heic_file)
-            
-            # Convert to RGB if necessary (HEIC can have different color modes)
-            if image.mode not in ('RGB', 'L'):
-                image = image.convert('RGB')
-            
-            # Save as JPG
-            image.save(output_file, 'JPEG', quality=quality, optimize=True)
-            
-            # Get file sizes for comparison
-            input_size = heic_file.stat().st_size / 1024  # KB
-            output_size = output_file.stat().st_size / 1024  # KB
-            
-            print(f"   ✅ Success! ({input_size:.1f} KB → {output_size:.1f} KB)")
-            converted_count += 1
-            
-        except Exception as e:
-            print(f"   ❌ Failed: {str(e)}")
-            failed_count += 1
-    
+
+    # imap_unordered with small chunks hands each worker a batch of files,
+    # cutting per-task IPC overhead and letting workers prefetch their
+    # next file while the current one is still encoding
+    convert = partial(_convert_one, output_dir=str(output_path),
+                      quality=quality, progressive=progressive)
+
+    with Pool(os.cpu_count()) as pool:
+        for name, input_size, output_size, error in pool.imap_unordered(
+                convert, [str(f) for f in pending_files], chunksize=4):
+            if error is None:
+                print(f"✅ {name} → {Path(name).stem + '.jpg'} ({input_size:.1f} KB → {output_size:.1f} KB)")
+                converted_count += 1
+            else:
+                print(f"❌ {name} failed: {error}")
+                failed_count += 1
+
     # Print summary
     print(f"\n{'='*60}")
     print(f"📊 Conversion Summary:")
     print(f"   ✅ Successfully converted: {converted_count}")
+    if skipped_count > 0:
+        print(f"   ⏭️  Skipped (up to date): {skipped_count}")
     if failed_count > 0:
         print(f"   ❌ Failed: {failed_count}")
     print(f"   📁 Output location: {output_path.absolute()}")
@@ -106,14 +192,22 @@ def main():
     input_dir = "assets/images/gallery"
     output_dir = "assets/images/gallery/converted"
     quality = 95
-    
+
+    # Progressive output is the default; pass --baseline to opt out.
+    # --force reconverts files whose JPG is already up to date.
+    progressive = '--baseline' not in sys.argv
+    force = '--force' in sys.argv
+
     print(f"📂 Input directory: {input_dir}")
     print(f"📁 Output directory: {output_dir}")
     print(f"🎨 Quality: {quality}")
+    print(f"📈 Progressive: {'yes' if progressive else 'no'}")
+    if force:
+        print("💪 Force: reconverting all files")
     print()
-    
+
     # Run conversion
-    convert_heic_to_jpg(input_dir, output_dir, quality)
+    convert_heic_to_jpg(input_dir, output_dir, quality, progressive, force)
     
     print("✨ Conversion complete!")
     print("\nPress Enter to exit...")
@@ -1,9 +1,12 @@
 from pathlib import Path
 
+from file_utils import scan_by_extension
+
 converted_dir = Path('assets/images/gallery/converted')
 
-jpg_files = sorted(converted_dir.glob('*.jpg'))
-png_files = sorted(list(converted_dir.glob('*.png')) + list(converted_dir.glob('*.PNG')))
+images = scan_by_extension(converted_dir, ('.jpg', '.png'))
+jpg_files = images['.jpg']
+png_files = images['.png']
 all_files = sorted(jpg_files + png_files)
 
 with open('image_count_result.txt', 'w') as f:
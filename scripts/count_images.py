@@ -1,13 +1,16 @@
 from pathlib import Path
 
+from file_utils import scan_by_extension
+
 converted_dir = Path('assets/images/gallery/converted')
 
 if not converted_dir.exists():
     print(f"Directory does not exist: {converted_dir}")
     exit(1)
 
-jpg_files = sorted(converted_dir.glob('*.jpg'))
-png_files = sorted(list(converted_dir.glob('*.png')) + list(converted_dir.glob('*.PNG')))
+images = scan_by_extension(converted_dir, ('.jpg', '.png'))
+jpg_files = images['.jpg']
+png_files = images['.png']
 
 print(f"\n=== Image Count ===")
 print(f"JPG files: {len(jpg_files)}")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Shared File Scanning Helpers
+============================
+One-pass directory scanning for the gallery scripts, replacing the
+repeated per-extension Path.glob calls (each of which re-walks the
+directory) with a single os.scandir pass and in-memory suffix checks.
+"""
+
+import os
+from pathlib import Path
+
+# Extensions the gallery pipeline cares about (matched case-insensitively)
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+
+
+def scan_by_extension(directory, extensions=IMAGE_EXTENSIONS):
+    """
+    Scan a directory once and bucket matching files by extension.
+
+    Args:
+        directory (str | Path): Directory to scan (non-recursive)
+        extensions (tuple): Lowercase extensions to match, with leading dot
+
+    Returns:
+        dict: {extension: sorted list of Path objects}, matched
+              case-insensitively against the file names. A missing
+              directory yields empty buckets, matching the old glob
+              behaviour instead of raising.
+    """
+    directory = Path(directory)
+    by_ext = {ext: [] for ext in extensions}
+
+    if not directory.exists():
+        return by_ext
+
+    with os.scandir(directory) as it:
+        for entry in it:
+            # follow_symlinks=False avoids an extra stat per entry
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext in by_ext:
+                by_ext[ext].append(directory / entry.name)
+
+    for files in by_ext.values():
+        files.sort()
+
+    return by_ext
+
+
+def list_images(directory, extensions=IMAGE_EXTENSIONS):
+    """
+    Return a sorted list of all matching files from a single scan.
+
+    Args:
+        directory (str | Path): Directory to scan (non-recursive)
+        extensions (tuple): Lowercase extensions to match, with leading dot
+
+    Returns:
+        list: Sorted Path objects for every matching file
+    """
+    by_ext = scan_by_extension(directory, extensions)
+    return sorted(f for files in by_ext.values() for f in files)
@@ -2,14 +2,18 @@
 from pathlib import Path
 import sys
 
+from file_utils import scan_by_extension
+from generate_gallery import generate_gallery_html
+
 # Force output
 sys.stdout.reconfigure(line_buffering=True)
 
 converted_dir = Path('assets/images/gallery/converted')
 
-# Get all image files
-jpg_files = list(converted_dir.glob('*.jpg'))
-png_files = list(converted_dir.glob('*.png')) + list(converted_dir.glob('*.PNG'))
+# Get all image files in one directory pass
+images = scan_by_extension(converted_dir, ('.jpg', '.png'))
+jpg_files = images['.jpg']
+png_files = images['.png']
 all_images = sorted(jpg_files + png_files)
 
 print(f"Found {len(all_images)} total images", flush=True)
@@ -17,4 +21,4 @@ print(f"  - JPG: {len(jpg_files)}", flush=True)
 print(f"  - PNG: {len(png_files)}", flush=True)
 
 # Now run the actual generation
-exec(open('generate_gallery.py').read())
+generate_gallery_html()
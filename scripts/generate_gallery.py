@@ -5,8 +5,11 @@ Gallery HTML Generator
 Automatically generates gallery HTML from converted images.
 """
 
+import re
 from pathlib import Path
 
+from file_utils import scan_by_extension
+
 # Image categories based on filename patterns
 CATEGORIES = {
     'members': {
@@ -46,19 +49,42 @@ CATEGORIES = {
     }
 }
 
+# Compile the patterns of each category into one alternation, tried in
+# CATEGORIES order so the first category wins no matter where in the
+# filename its pattern appears (a single combined regex would let the
+# earliest match position win instead)
+CATEGORY_PATTERNS = [
+    (cat_id, re.compile('|'.join(re.escape(p) for p in cat_info['patterns']), re.IGNORECASE))
+    for cat_id, cat_info in CATEGORIES.items() if cat_info['patterns']
+]
+
 def categorize_image(filename):
     """Determine category based on filename."""
-    filename_lower = filename.lower()
-    
-    for cat_id, cat_info in CATEGORIES.items():
-        if cat_id == 'misc':
-            continue
-        for pattern in cat_info['patterns']:
-            if pattern in filename_lower:
-                return cat_id
-    
+    # The patterns are case-insensitive, so no per-call .lower() is needed
+    for cat_id, pattern in CATEGORY_PATTERNS:
+        if pattern.search(filename):
+            return cat_id
     return 'misc'
 
+def filter_button_html(cat_id, icon, name, count):
+    """Render one filter button."""
+    return f'''        <button class="btn btn-outline-primary" data-filter="{cat_id}">
+          <i class="bi bi-{icon}"></i> {name} ({count})
+        </button>
+'''
+
+def gallery_tile_html(cat_id, href, alt_text):
+    """Render one gallery tile."""
+    return f'''        <div class="gallery-item" data-category="{cat_id}">
+          <a href="{href}" class="glightbox" data-gallery="tozan-gallery">
+            <img src="{href}" alt="{alt_text}" loading="lazy" />
+            <div class="gallery-overlay">
+              <i class="bi bi-zoom-in"></i>
+            </div>
+          </a>
+        </div>
+'''
+
 def generate_gallery_html():
     """Generate gallery HTML from converted images."""
     
@@ -68,10 +94,9 @@ def generate_gallery_html():
         print("❌ Converted directory not found!")
         return
     
-    # Get all JPG and PNG files
-    jpg_images = list(converted_dir.glob('*.jpg'))
-    png_images = list(converted_dir.glob('*.png')) + list(converted_dir.glob('*.PNG'))
-    images = sorted(jpg_images + png_images)
+    # Get all JPG and PNG files in one directory pass
+    by_ext = scan_by_extension(converted_dir, ('.jpg', '.png'))
+    images = sorted(by_ext['.jpg'] + by_ext['.png'])
     
     if not images:
         print("❌ No images found!")
@@ -86,48 +111,35 @@ def generate_gallery_html():
         category = categorize_image(img.name)
         categorized[category].append(img)
     
-    # Generate HTML
-    html_parts = []
-    
-    # Add filter buttons
-    html_parts.append('''      <div class="gallery-filters mb-4 text-center">
-        <button class="btn btn-outline-primary active" data-filter="all">
-          <i class="bi bi-grid-3x3"></i> All ({})
-        </button>'''.format(len(images)))
-    
-    for cat_id, cat_info in CATEGORIES.items():
-        count = len(categorized[cat_id])
-        if count > 0:
-            html_parts.append('''        <button class="btn btn-outline-primary" data-filter="{}">
-          <i class="bi bi-{}"></i> {} ({})
-        </button>'''.format(cat_id, cat_info['icon'], cat_info['name'], count))
-    
-    html_parts.append('      </div>\n')
-    
-    # Add gallery grid
-    html_parts.append('      <div class="gallery-grid">\n')
-    
-    # Add images
-    for cat_id in CATEGORIES.keys():
-        for img in categorized[cat_id]:
-            # Create nice alt text from filename
-            alt_text = img.stem.replace('-', ' ').replace('_', ' ').title()
-            
-            html_parts.append('''        <div class="gallery-item" data-category="{}">
-          <a href="{}" class="glightbox" data-gallery="tozan-gallery">
-            <img src="{}" alt="{}" loading="lazy" />
-            <div class="gallery-overlay">
-              <i class="bi bi-zoom-in"></i>
-            </div>
-          </a>
-        </div>\n'''.format(cat_id, img.as_posix(), img.as_posix(), alt_text))
-    
-    html_parts.append('      </div>')
-    
-    # Write to file
+    # Stream the HTML straight to the file through a large write buffer,
+    # so peak memory stays at the buffer size regardless of image count
     output_file = 'gallery_generated.html'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(html_parts))
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        # Add filter buttons
+        f.write(f'''      <div class="gallery-filters mb-4 text-center">
+        <button class="btn btn-outline-primary active" data-filter="all">
+          <i class="bi bi-grid-3x3"></i> All ({len(images)})
+        </button>
+''')
+
+        for cat_id, cat_info in CATEGORIES.items():
+            count = len(categorized[cat_id])
+            if count > 0:
+                f.write(filter_button_html(cat_id, cat_info['icon'], cat_info['name'], count))
+
+        f.write('      </div>\n\n')
+
+        # Add gallery grid
+        f.write('      <div class="gallery-grid">\n\n')
+
+        # Add images
+        for cat_id in CATEGORIES.keys():
+            for img in categorized[cat_id]:
+                # Create nice alt text from filename
+                alt_text = img.stem.replace('-', ' ').replace('_', ' ').title()
+                f.write(gallery_tile_html(cat_id, img.as_posix(), alt_text))
+
+        f.write('      </div>')
     
     print(f"\n✅ Gallery HTML generated: {output_file}")
     print(f"\n📊 Category breakdown:")
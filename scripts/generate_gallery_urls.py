@@ -1,42 +1,75 @@
 #!/usr/bin/env python3
 """
-Generate gallery URLs from image_list.js for the new gallery.html
+Generate gallery URLs from image_list.json for the new gallery.html
 """
 
 import json
 import re
 
+from jinja2 import Template
+
 # Base URL for Cloudflare R2
 BASE_URL = "https://pub-b6d85dc4453b487d879f35b1669c3da2.r2.dev/images/"
 
-# Read the image list from image_list.js
-with open('image_list.js', 'r') as f:
-    content = f.read()
-
-# Extract the array content using regex
-array_match = re.search(r'const ACTUAL_IMAGES = \[(.*?)\];', content, re.DOTALL)
-if array_match:
-    array_content = array_match.group(1)
-    # Parse the JavaScript array
-    images = []
-    for line in array_content.split('\n'):
-        line = line.strip()
-        if line.startswith("'") and line.endswith("',"):
-            image_name = line[1:-2]  # Remove quotes and comma
-            images.append(image_name)
-        elif line.startswith("'") and line.endswith("'"):
-            image_name = line[1:-1]  # Remove quotes
-            images.append(image_name)
+# Compiled once at import; every render reuses the cached bytecode
+GALLERY_TEMPLATE = Template('''\
+{% for category, images in manifest.items() if images %}
+    <!-- {{ category }} -->
+    <div class="gallery-category" id="{{ category|lower|replace(' ', '-')|replace('&', 'and') }}">
+      <h3 class="category-title">
+        <i class="bi bi-collection"></i> {{ category }}
+        <span class="photo-count">({{ images|length }} photos)</span>
+      </h3>
+      <div class="gallery-grid">
+{% for image in images %}\
+        <div class="gallery-item">
+          <a href="{{ image.url }}" class="glightbox" data-gallery="{{ category|lower|replace(' ', '-') }}">
+            <img src="{{ image.url }}" alt="{{ image.alt }}" loading="lazy" />
+            <div class="gallery-overlay">
+              <i class="bi bi-zoom-in"></i>
+            </div>
+          </a>
+        </div>
+{% endfor %}\
+      </div>
+    </div>
+{% endfor %}''')
+
+# Read the image list (written by generate_image_list.py alongside
+# image_list.js) - JSON parses in C instead of a per-line regex loop
+with open('image_list.json', 'r') as f:
+    images = json.load(f)
 
 # Remove duplicates while preserving order
-unique_images = []
-seen = set()
-for img in images:
-    if img not in seen:
-        unique_images.append(img)
-        seen.add(img)
-
-# Categorize images for better organization
+unique_images = list(dict.fromkeys(images))
+
+# Keywords per category; each list is compiled into one alternation and
+# the patterns are tried in table order, so earlier categories keep
+# priority no matter where in the filename their keyword appears
+CATEGORY_KEYWORDS = [
+    ('Members & Group Photos',
+     ['members-', 'member-']),
+    ('Head Temple & Premises',
+     ['headtemple-', 'head-temple-', 'temple-premises-', 'temple-', 'tokohibo-',
+      'seikado-', 'treasury-hall-', 'salmon-gate-', 'pagoda-']),
+    ('Mount Fuji Views',
+     ['mount-fuji', 'fuji-']),
+    ('Hotels & Accommodation',
+     ['hotel-', 'fujiyen-']),
+    ('Travel & Journey',
+     ['hongkong-', 'narita-', 'cathay-', 'cx-', 'airport']),
+    ('Temple Activities',
+     ['gokai-', 'map-', 'butsugu-']),
+    ('Ceremony & Special Events',
+     ['ceremony-day-']),
+]
+
+CATEGORY_PATTERNS = [
+    (name, re.compile('|'.join(re.escape(k) for k in keywords)))
+    for name, keywords in CATEGORY_KEYWORDS
+]
+DEFAULT_CATEGORY = 'Local Places & Food'
+
 categories = {
     'Members & Group Photos': [],
     'Head Temple & Premises': [],
@@ -48,67 +81,50 @@ categories = {
     'Ceremony & Special Events': []
 }
 
-for img in unique_images:
-    img_lower = img.lower()
-    
-    if any(keyword in img_lower for keyword in ['members-', 'member-']):
-        if 'ceremony' in img_lower:
-            categories['Ceremony & Special Events'].append(img)
-        else:
-            categories['Members & Group Photos'].append(img)
-    elif any(keyword in img_lower for keyword in ['headtemple-', 'head-temple-', 'temple-premises-', 'temple-', 'tokohibo-', 'seikado-', 'treasury-hall-', 'salmon-gate-', 'pagoda-']):
-        categories['Head Temple & Premises'].append(img)
-    elif 'mount-fuji' in img_lower or 'fuji-' in img_lower:
-        categories['Mount Fuji Views'].append(img)
-    elif any(keyword in img_lower for keyword in ['hotel-', 'fujiyen-']):
-        categories['Hotels & Accommodation'].append(img)
-    elif any(keyword in img_lower for keyword in ['hongkong-', 'narita-', 'cathay-', 'cx-', 'airport']):
-        categories['Travel & Journey'].append(img)
-    elif any(keyword in img_lower for keyword in ['gokai-', 'map-', 'butsugu-']):
-        categories['Temple Activities'].append(img)
-    elif any(keyword in img_lower for keyword in ['ceremony-day-']):
-        categories['Ceremony & Special Events'].append(img)
+# Lowercase each filename once up front; the categorization scan and
+# the alt-text generation below all reuse the same pair
+items = [(img, img.lower()) for img in unique_images]
+
+for item in items:
+    img, img_lower = item
+
+    for category, pattern in CATEGORY_PATTERNS:
+        if pattern.search(img_lower):
+            break
     else:
-        categories['Local Places & Food'].append(img)
+        category = DEFAULT_CATEGORY
 
-# Generate HTML for each category
-html_sections = []
+    # Member shots taken around the ceremony file under special events
+    if category == 'Members & Group Photos' and 'ceremony' in img_lower:
+        category = 'Ceremony & Special Events'
 
-for category, images in categories.items():
-    if not images:
-        continue
-        
-    html_sections.append(f'''
-    <!-- {category} -->
-    <div class="gallery-category" id="{category.lower().replace(' ', '-').replace('&', 'and')}">
-      <h3 class="category-title">
-        <i class="bi bi-collection"></i> {category}
-        <span class="photo-count">({len(images)} photos)</span>
-      </h3>
-      <div class="gallery-grid">''')
-    
-    for img in images:
-        # Create a nice alt text from filename
-        alt_text = img.replace('-', ' ').replace('.jpg', '').replace('.PNG', '').title()
-        
-        html_sections.append(f'''        <div class="gallery-item">
-          <a href="{BASE_URL}{img}" class="glightbox" data-gallery="{category.lower().replace(' ', '-')}">
-            <img src="{BASE_URL}{img}" alt="{alt_text}" loading="lazy" />
-            <div class="gallery-overlay">
-              <i class="bi bi-zoom-in"></i>
-            </div>
-          </a>
-        </div>''')
-    
-    html_sections.append('''      </div>
-    </div>''')
+    categories[category].append(item)
+
+# Build the manifest: every category maps to its image records, with the
+# alt text derived from the precomputed lowercase filename
+# (.title() recapitalizes, so starting from lowercase is lossless)
+manifest = {
+    category: [
+        {
+            'name': img,
+            'url': BASE_URL + img,
+            'alt': img_lower.replace('-', ' ').replace('.jpg', '').replace('.png', '').title(),
+        }
+        for img, img_lower in images
+    ]
+    for category, images in categories.items()
+}
+
+# Persist the manifest for downstream tooling (search, thumbnails, ...)
+with open('gallery_manifest.json', 'w', encoding='utf-8') as f:
+    json.dump(manifest, f, indent=2)
 
-# Write the HTML sections to a file
-with open('gallery_sections.html', 'w') as f:
-    f.write('\n'.join(html_sections))
+# Render the HTML sections through the precompiled template
+with open('gallery_sections.html', 'w', encoding='utf-8') as f:
+    GALLERY_TEMPLATE.stream(manifest=manifest).dump(f)
 
 print(f"Generated gallery HTML for {len(unique_images)} unique images across {len([c for c in categories.values() if c])} categories")
-print("Output saved to gallery_sections.html")
+print("Output saved to gallery_sections.html (manifest in gallery_manifest.json)")
 
 # Also create a summary
 print("\nCategory Summary:")
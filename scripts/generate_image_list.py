@@ -2,12 +2,15 @@
 """
 Generate Image List for Gallery
 ===============================
-Creates a JavaScript array of all images from the converted folder
+Creates a minified JSON array (plus a legacy JavaScript array) of all
+images from the converted folder
 """
 
 from pathlib import Path
 import json
 
+from file_utils import list_images
+
 def generate_image_list():
     converted_dir = Path('assets/images/gallery/converted')
     
@@ -15,30 +18,29 @@ def generate_image_list():
         print("❌ Converted directory not found!")
         return
     
-    # Get all image files
-    image_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif']
-    images = []
-    
-    for ext in image_extensions:
-        images.extend(converted_dir.glob(f'*{ext}'))
-        images.extend(converted_dir.glob(f'*{ext.upper()}'))
-    
+    # Get all image files in one directory pass
+    images = list_images(converted_dir)
+
     # Extract just the filenames
-    image_names = [img.name for img in sorted(images)]
+    image_names = [img.name for img in images]
     
     print(f"📸 Found {len(image_names)} images")
     
-    # Generate JavaScript array
-    js_array = "const ACTUAL_IMAGES = [\n"
-    for img in image_names:
-        js_array += f"  '{img}',\n"
-    js_array += "];"
-    
-    # Write to file
+    # Primary artifact: a minified JSON array - half the size of the JS
+    # source and parsed natively by both Python and the browser
+    with open('image_list.json', 'w', encoding='utf-8') as f:
+        f.write(json.dumps(image_names, separators=(',', ':')))
+
+    # Keep the legacy JS array for anything still including it; built
+    # with a single join instead of quadratic string concatenation
+    js_array = "const ACTUAL_IMAGES = [\n" + ''.join(
+        f"  '{img}',\n" for img in image_names
+    ) + "];"
+
     with open('image_list.js', 'w', encoding='utf-8') as f:
         f.write(js_array)
-    
-    print(f"✅ Generated image_list.js with {len(image_names)} images")
+
+    print(f"✅ Generated image_list.json (primary) and image_list.js with {len(image_names)} images")
     
     # Also print first few for verification
     print("\n📋 First 10 images:")
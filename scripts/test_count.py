@@ -1,8 +1,11 @@
 from pathlib import Path
 
+from file_utils import scan_by_extension
+
 converted_dir = Path('assets/images/gallery/converted')
-jpg_images = list(converted_dir.glob('*.jpg'))
-png_images = list(converted_dir.glob('*.png')) + list(converted_dir.glob('*.PNG'))
+images = scan_by_extension(converted_dir, ('.jpg', '.png'))
+jpg_images = images['.jpg']
+png_images = images['.png']
 all_images = jpg_images + png_images
 
 print(f"JPG images: {len(jpg_images)}")